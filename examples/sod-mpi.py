@@ -27,7 +27,6 @@ import pyopencl.tools as cl_tools
 from functools import partial
 from mpi4py import MPI
 
-from meshmode.array_context import PyOpenCLArrayContext
 from meshmode.dof_array import thaw
 from meshmode.mesh import BTAG_ALL, BTAG_NONE  # noqa
 from grudge.eager import EagerDGDiscretization
@@ -41,7 +40,8 @@ from mirgecom.simutil import (
     create_parallel_grid,
     ExactSolutionMismatch,
 )
-from mirgecom.io import make_init_message
+from mirgecom.io import make_init_message, AsyncVisualizationWriter
+from mirgecom.specialization import PyOpenCLShapeSpecializingArrayContext
 
 from mirgecom.integrators import rk4_step
 from mirgecom.steppers import advance_state
@@ -56,7 +56,7 @@ logger = logging.getLogger(__name__)
 def main(ctx_factory=cl.create_some_context):
     cl_ctx = ctx_factory()
     queue = cl.CommandQueue(cl_ctx)
-    actx = PyOpenCLArrayContext(queue,
+    actx = PyOpenCLShapeSpecializingArrayContext(queue,
                 allocator=cl_tools.MemoryPool(cl_tools.ImmediateAllocator(queue)))
 
     dim = 1
@@ -99,8 +99,9 @@ def main(ctx_factory=cl.create_some_context):
     nodes = thaw(actx, discr.nodes())
     current_state = initializer(0, nodes)
 
-    visualizer = make_visualizer(discr, discr.order + 3
-                                 if discr.dim == 2 else discr.order)
+    visualizer = AsyncVisualizationWriter(
+        make_visualizer(discr, discr.order + 3
+                        if discr.dim == 2 else discr.order))
     initname = initializer.__class__.__name__
     eosname = eos.__class__.__name__
     init_message = make_init_message(dim=dim, order=order,
@@ -113,9 +114,12 @@ def main(ctx_factory=cl.create_some_context):
     if rank == 0:
         logger.info(init_message)
 
-    get_timestep = partial(inviscid_sim_timestep, discr=discr, t=current_t,
-                           dt=current_dt, cfl=current_cfl, eos=eos,
-                           t_final=t_final, constant_cfl=constant_cfl)
+    if constant_cfl:
+        get_timestep = partial(inviscid_sim_timestep, discr=discr, t=current_t,
+                               dt=current_dt, cfl=current_cfl, eos=eos,
+                               t_final=t_final, constant_cfl=constant_cfl)
+    else:
+        get_timestep = current_dt
 
     def my_rhs(t, state):
         return inviscid_operator(discr, q=state, t=t,
@@ -125,7 +129,8 @@ def main(ctx_factory=cl.create_some_context):
         return sim_checkpoint(discr, visualizer, eos, q=state,
                               exact_soln=initializer, vizname=casename, step=step,
                               t=t, dt=dt, nstatus=nstatus, nviz=nviz,
-                              exittol=exittol, constant_cfl=constant_cfl, comm=comm)
+                              exittol=exittol, constant_cfl=constant_cfl, comm=comm,
+                              nodes=nodes, rank=rank)
 
     try:
         (current_step, current_t, current_state) = \
@@ -137,14 +142,18 @@ def main(ctx_factory=cl.create_some_context):
         current_step = ex.step
         current_t = ex.t
         current_state = ex.state
-
-    #    if current_t != checkpoint_t:
-    if rank == 0:
-        logger.info("Checkpointing final state ...")
-        my_checkpoint(current_step, t=current_t,
-                      dt=(current_t - checkpoint_t),
+        # The checkpoint that raised has already reported this state, and
+        # dumped it if this was a viz step
+        checkpoint_t = current_t
+
+    if current_t != checkpoint_t:
+        if rank == 0:
+            logger.info("Checkpointing final state ...")
+        my_checkpoint(current_step, t=current_t, dt=current_dt,
                       state=current_state)
 
+    visualizer.close()
+
     if current_t - t_final < 0:
         raise ValueError("Simulation exited abnormally")
 
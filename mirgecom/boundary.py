@@ -31,6 +31,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
 
+from pytools import memoize_in
 from meshmode.dof_array import thaw
 from meshmode.mesh import BTAG_ALL, BTAG_NONE  # noqa
 from mirgecom.eos import IdealSingleGas
@@ -61,8 +62,11 @@ class PrescribedBoundary:
         """Get the interior and exterior solution on the boundary."""
         actx = q[0].array_context
 
-        boundary_discr = discr.discr_from_dd(btag)
-        nodes = thaw(actx, boundary_discr.nodes())
+        @memoize_in(discr, (PrescribedBoundary.boundary_pair, "thawed_nodes", btag))
+        def thawed_nodes():
+            return thaw(actx, discr.discr_from_dd(btag).nodes())
+
+        nodes = thawed_nodes()
         ext_soln = self._userfunc(t, nodes)
         int_soln = discr.project("vol", btag, q)
         return TracePair(btag, interior=int_soln, exterior=ext_soln)
@@ -22,6 +22,8 @@ State Vector Handling
 
 .. autoclass:: ConservedVars
 .. autofunction:: split_conserved
+.. autofunction:: flatten_conserved
+.. autofunction:: unflatten_conserved
 
 RHS Evaluation
 ^^^^^^^^^^^^^^
@@ -63,13 +65,13 @@ THE SOFTWARE.
 from dataclasses import dataclass
 
 import numpy as np
+from pytools import memoize_in
 from pytools.obj_array import make_obj_array
+from meshmode.array_context import make_loopy_program
 from meshmode.dof_array import thaw
-from meshmode.mesh import BTAG_ALL, BTAG_NONE  # noqa
-from grudge.eager import (
-    interior_trace_pair,
-    cross_rank_trace_pairs
-)
+from meshmode.mesh import BTAG_ALL, BTAG_NONE, BTAG_PARTITION  # noqa
+from grudge.eager import interior_trace_pair
+from grudge.symbolic.primitives import TracePair
 
 
 @dataclass
@@ -141,6 +143,49 @@ def join_conserved(dim, mass, energy, momentum):
     return result
 
 
+def flatten_conserved(q):
+    """Pack an agglomerated state into one contiguous array.
+
+    Return an array of shape ``(ncomp, ndofs)`` whose *i*-th row holds the
+    flattened DOFs of component *i* of the object array *q*, so that all
+    conserved quantities live in a single structure-of-arrays buffer with the
+    DOF index fastest.
+    """
+    actx = q[0].array_context
+
+    @memoize_in(actx, (flatten_conserved, "flatten_conserved_prg"))
+    def prg():
+        return make_loopy_program(
+            "{[iel, idof]: 0 <= iel < nelements and 0 <= idof < ndofs_per_element}",
+            "result[icomp, grp_start + iel*ndofs_per_element + idof] "
+            "= grp_ary[iel, idof]",
+            name="flatten_conserved")
+
+    group_sizes = [grp_ary.shape[0] * grp_ary.shape[1] for grp_ary in q[0]]
+    group_starts = np.cumsum([0] + group_sizes)
+
+    result = actx.empty((len(q), group_starts[-1]), dtype=q[0].entry_dtype)
+    for icomp, component in enumerate(q):
+        for grp_start, grp_ary in zip(group_starts, component):
+            actx.call_loopy(prg(), grp_ary=grp_ary, result=result,
+                            icomp=icomp, grp_start=grp_start)
+
+    return result
+
+
+def unflatten_conserved(actx, discr, soa, dd="vol"):
+    """Unpack an array created by :func:`flatten_conserved`.
+
+    Return an agglomerated object array of DOF arrays on the part of *discr*
+    described by *dd*.
+    """
+    from meshmode.dof_array import unflatten
+    dof_discr = discr.discr_from_dd(dd)
+    return make_obj_array([
+        unflatten(actx, dof_discr, soa[i]) for i in range(soa.shape[0])
+    ])
+
+
 def scalar(s):
     """Create an object array for a scalar."""
     return make_obj_array([s])
@@ -196,9 +241,152 @@ def _facial_flux(discr, eos, q_tpair):
     return discr.project(q_tpair.dd, "all_faces", flux_weak)
 
 
+def _get_host_staging_array(actx, key, shape, dtype):
+    """Return a page-locked host array reused across calls with the same *key*.
+
+    The array is backed by an OpenCL buffer allocated with
+    :attr:`pyopencl.mem_flags.ALLOC_HOST_PTR` that stays mapped for the
+    lifetime of *actx*, so transfers from and to it can use DMA directly.
+    """
+    @memoize_in(actx, (_get_host_staging_array, "staging_arrays"))
+    def staging_arrays():
+        return {}
+
+    arrays = staging_arrays()
+    key = (key, shape, np.dtype(dtype))
+    try:
+        return arrays[key][1]
+    except KeyError:
+        import pyopencl as cl
+        nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        buf = cl.Buffer(actx.context,
+                        cl.mem_flags.READ_WRITE | cl.mem_flags.ALLOC_HOST_PTR,
+                        nbytes)
+        ary, _ = cl.enqueue_map_buffer(
+            actx.queue, buf, cl.map_flags.READ | cl.map_flags.WRITE,
+            0, shape, dtype)
+        arrays[key] = (buf, ary)
+        return ary
+
+
+class _RankBoundaryExchange:
+    """Exchange the trace of a whole state vector with one neighboring rank.
+
+    All components are packed into a single device buffer before staging, so
+    that each neighbor costs one device-to-host transfer and one message
+    rather than one of each per component. The host side of the exchange
+    uses page-locked arrays that are reused from one exchange to the next.
+    """
+
+    tag = 1373
+
+    def __init__(self, discr, remote_rank, q):
+        self.discr = discr
+        self.array_context = q[0].array_context
+        self.remote_btag = BTAG_PARTITION(remote_rank)
+        self.local_q = discr.project("vol", self.remote_btag, q)
+
+        local_soa = flatten_conserved(self.local_q)
+        local_data = _get_host_staging_array(
+            self.array_context, ("send", remote_rank),
+            local_soa.shape, local_soa.dtype)
+        local_soa.get(ary=local_data)
+
+        comm = discr.mpi_communicator
+        self.send_req = comm.Isend(local_data, remote_rank, tag=self.tag)
+
+        self.remote_data_host = _get_host_staging_array(
+            self.array_context, ("recv", remote_rank),
+            local_soa.shape, local_soa.dtype)
+        self.recv_req = comm.Irecv(self.remote_data_host, remote_rank, self.tag)
+
+    def finish(self):
+        """Wait for the neighbor's data and return the partition trace pair."""
+        from grudge import sym
+
+        self.recv_req.Wait()
+
+        bdry_conn = self.discr.get_distributed_boundary_swap_connection(
+            sym.as_dofdesc(sym.DTAG_BOUNDARY(self.remote_btag)))
+        remote_q = unflatten_conserved(
+            self.array_context, self.discr,
+            self.array_context.from_numpy(self.remote_data_host),
+            dd=self.remote_btag)
+        remote_q = make_obj_array([bdry_conn(comp) for comp in remote_q])
+
+        self.send_req.Wait()
+
+        return TracePair(self.remote_btag, interior=self.local_q,
+                         exterior=remote_q)
+
+
+def _begin_partition_exchange(discr, q):
+    """Post nonblocking sends and receives of *q* to every neighboring rank.
+
+    Returns a list of :class:`_RankBoundaryExchange`, one per neighboring rank.
+    """
+    from grudge.eager import connected_ranks
+    return [
+        _RankBoundaryExchange(discr, remote_rank, q)
+        for remote_rank in connected_ranks(discr)
+    ]
+
+
+def _local_face_flux(discr, eos, boundaries, q, t=0.0):
+    """Return the flux across interior faces and domain boundaries.
+
+    None of these faces need data from other ranks.
+    """
+    interior_face_flux = _facial_flux(
+        discr, eos=eos, q_tpair=interior_trace_pair(discr, q))
+
+    domain_boundary_flux = sum(
+        _facial_flux(
+            discr,
+            q_tpair=boundaries[btag].boundary_pair(discr,
+                                                   eos=eos,
+                                                   btag=btag,
+                                                   t=t,
+                                                   q=q),
+            eos=eos
+        )
+        for btag in boundaries
+    )
+
+    return interior_face_flux + domain_boundary_flux
+
+
+def _partition_face_flux(discr, eos, exchange):
+    """Return the flux across partition boundaries.
+
+    Completes the communication posted by :func:`_begin_partition_exchange`,
+    computing the flux for each neighboring rank as soon as its data has
+    arrived.
+    """
+    if not exchange:
+        return 0
+
+    from mpi4py import MPI
+
+    partition_flux = 0
+    pending = list(exchange)
+    while pending:
+        i = MPI.Request.Waitany([rank_exchange.recv_req
+                                 for rank_exchange in pending])
+        q_tpair = pending.pop(i).finish()
+        partition_flux = partition_flux + _facial_flux(
+            discr, eos=eos, q_tpair=q_tpair)
+
+    return partition_flux
+
+
 def inviscid_operator(discr, eos, boundaries, q, t=0.0):
     r"""Compute RHS of the Euler flow equations.
 
+    The exchange of partition boundary data with neighboring ranks is started
+    before, and completed after, the volume and rank-local face flux
+    computation so that communication overlaps with that work.
+
     Returns
     -------
     The right-hand-side of the Euler flow equations:
@@ -222,35 +410,18 @@ def inviscid_operator(discr, eos, boundaries, q, t=0.0):
         Implementing the pressure and temperature functions for
         returning pressure and temperature as a function of the state q.
     """
+    exchange = _begin_partition_exchange(discr, q)
+
     vol_flux = inviscid_flux(discr, eos, q)
     dflux = discr.weak_div(vol_flux)
 
-    interior_face_flux = _facial_flux(
-        discr, eos=eos, q_tpair=interior_trace_pair(discr, q))
-
-    # Domain boundaries
-    domain_boundary_flux = sum(
-        _facial_flux(
-            discr,
-            q_tpair=boundaries[btag].boundary_pair(discr,
-                                                   eos=eos,
-                                                   btag=btag,
-                                                   t=t,
-                                                   q=q),
-            eos=eos
-        )
-        for btag in boundaries
-    )
+    local_face_flux = _local_face_flux(discr, eos, boundaries, q, t=t)
 
     # Flux across partition boundaries
-    partition_boundary_flux = sum(
-        _facial_flux(discr, eos=eos, q_tpair=part_pair)
-        for part_pair in cross_rank_trace_pairs(discr, q)
-    )
+    partition_boundary_flux = _partition_face_flux(discr, eos, exchange)
 
     return discr.inverse_mass(
-        dflux - discr.face_mass(interior_face_flux + domain_boundary_flux
-                                + partition_boundary_flux)
+        dflux - discr.face_mass(local_face_flux + partition_boundary_flux)
     )
 
 
@@ -109,8 +109,7 @@ class Vortex2D:
         y_rel = x_vec[1] - vortex_loc[1]
         actx = x_vec[0].array_context
         gamma = eos.gamma()
-        r = actx.np.sqrt(x_rel ** 2 + y_rel ** 2)
-        expterm = self._beta * actx.np.exp(1 - r ** 2)
+        expterm = self._beta * actx.np.exp(1 - (x_rel ** 2 + y_rel ** 2))
         u = self._velocity[0] - expterm * y_rel / (2 * np.pi)
         v = self._velocity[1] + expterm * x_rel / (2 * np.pi)
         mass = (1 - (gamma - 1) / (16 * gamma * np.pi ** 2)
@@ -315,14 +314,11 @@ class Lump:
         lump_loc = self._center + t * self._velocity
         assert len(x_vec) == self._dim
         # coordinates relative to lump center
-        rel_center = make_obj_array(
-            [x_vec[i] - lump_loc[i] for i in range(self._dim)]
-        )
+        rel_center = x_vec - lump_loc
         actx = x_vec[0].array_context
-        r = actx.np.sqrt(np.dot(rel_center, rel_center))
 
         gamma = eos.gamma()
-        expterm = self._rhoamp * actx.np.exp(1 - r ** 2)
+        expterm = self._rhoamp * actx.np.exp(1 - np.dot(rel_center, rel_center))
         mass = expterm + self._rho0
         mom = self._velocity * make_obj_array([mass])
         energy = (self._p0 / (gamma - 1.0)) + np.dot(mom, mom) / (2.0 * mass)
@@ -348,16 +344,13 @@ class Lump:
         nodes = thaw(actx, discr.nodes())
         lump_loc = self._center + t * self._velocity
         # coordinates relative to lump center
-        rel_center = make_obj_array(
-            [nodes[i] - lump_loc[i] for i in range(self._dim)]
-        )
-        r = actx.np.sqrt(np.dot(rel_center, rel_center))
+        rel_center = nodes - lump_loc
 
         # The expected rhs is:
         # rhorhs  = -2*rho*(r.dot.v)
         # rhoerhs = -rho*v^2*(r.dot.v)
         # rhovrhs = -2*rho*(r.dot.v)*v
-        expterm = self._rhoamp * actx.np.exp(1 - r ** 2)
+        expterm = self._rhoamp * actx.np.exp(1 - np.dot(rel_center, rel_center))
         mass = expterm + self._rho0
 
         v = self._velocity * make_obj_array([1.0 / mass])
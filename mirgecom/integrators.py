@@ -35,8 +35,118 @@ THE SOFTWARE.
 """
 
 
+import numpy as np
+from pytools import memoize_in
+from meshmode.array_context import make_loopy_program
+from meshmode.dof_array import DOFArray
+
+
+def _is_dof_array_state(state):
+    return (isinstance(state, np.ndarray) and state.dtype.char == "O"
+            and not isinstance(state, DOFArray)
+            and all(isinstance(comp, DOFArray) for comp in state.flat))
+
+
+def _apply_groupwise(prg, scalars, **fields):
+    """Apply *prg* to each group of each component of the object arrays *fields*.
+
+    Returns an object array of :class:`~meshmode.dof_array.DOFArray` holding the
+    *result* output of *prg*.
+    """
+    template = next(iter(fields.values()))
+    actx = template.flat[0].array_context
+
+    result = np.empty(template.shape, dtype=object)
+    for idx in np.ndindex(template.shape):
+        result[idx] = DOFArray.from_list(actx, [
+            actx.call_loopy(
+                prg, **scalars,
+                **{name: field[idx][igrp] for name, field in fields.items()}
+            )["result"]
+            for igrp in range(len(template[idx]))
+        ])
+    return result
+
+
+def _rk4_stage(state, a, k):
+    """Return ``state + a*k`` in a single pass over the data."""
+    actx = state.flat[0].array_context
+
+    @memoize_in(actx, (_rk4_stage, "rk4_stage_prg"))
+    def prg():
+        return make_loopy_program(
+            "{[iel, idof]: 0 <= iel < nelements and 0 <= idof < ndofs}",
+            "result[iel, idof] = y[iel, idof] + a*k[iel, idof]",
+            name="rk4_stage")
+
+    dtype = state.flat[0].entry_dtype
+    return _apply_groupwise(prg(), {"a": dtype.type(a)}, y=state, k=k)
+
+
+def _rk4_combine(state, dt, k1, k2, k3, k4):
+    """Return the RK4 update of *state* in a single pass over the data."""
+    actx = state.flat[0].array_context
+
+    @memoize_in(actx, (_rk4_combine, "rk4_combine_prg"))
+    def prg():
+        return make_loopy_program(
+            "{[iel, idof]: 0 <= iel < nelements and 0 <= idof < ndofs}",
+            """
+            result[iel, idof] = y[iel, idof] + dt6*(
+                k1[iel, idof] + 2*k2[iel, idof] + 2*k3[iel, idof] + k4[iel, idof])
+            """,
+            name="rk4_combine")
+
+    dtype = state.flat[0].entry_dtype
+    return _apply_groupwise(prg(), {"dt6": dtype.type(dt/6)},
+                            y=state, k1=k1, k2=k2, k3=k3, k4=k4)
+
+
+def _rk4_step_host(state, t, dt, rhs):
+    """Implement an RK4 step for a numeric :class:`numpy.ndarray` state.
+
+    Each stage state and the final combination are built in a single new
+    array with in-place operations, instead of allocating a temporary for
+    every intermediate result.
+    """
+    def stage(a, k):
+        result = np.multiply(k, a)
+        result += state
+        return result
+
+    k1 = rhs(t, state)
+    k2 = rhs(t+dt/2, stage(dt/2, k1))
+    k3 = rhs(t+dt/2, stage(dt/2, k2))
+    k4 = rhs(t+dt, stage(dt, k3))
+
+    result = np.add(k2, k3)
+    result *= 2
+    result += k1
+    result += k4
+    result *= dt/6
+    result += state
+    return result
+
+
 def rk4_step(state, t, dt, rhs):
-    """Implement a generic RK4 time step state/rhs pair."""
+    """Implement a generic RK4 time step state/rhs pair.
+
+    If *state* is an object array of :class:`~meshmode.dof_array.DOFArray`,
+    each stage update and the final combination are done in a single fused
+    kernel instead of a chain of elementwise array operations. A numeric
+    :class:`numpy.ndarray` *state* is advanced with in-place operations on
+    one new array per stage.
+    """
+    if isinstance(state, np.ndarray) and state.dtype.char != "O":
+        return _rk4_step_host(state, t, dt, rhs)
+
+    if _is_dof_array_state(state):
+        k1 = rhs(t, state)
+        k2 = rhs(t+dt/2, _rk4_stage(state, dt/2, k1))
+        k3 = rhs(t+dt/2, _rk4_stage(state, dt/2, k2))
+        k4 = rhs(t+dt, _rk4_stage(state, dt, k3))
+        return _rk4_combine(state, dt, k1, k2, k3, k4)
+
     k1 = rhs(t, state)
     k2 = rhs(t+dt/2, state + dt/2*k1)
     k3 = rhs(t+dt/2, state + dt/2*k2)
@@ -3,6 +3,7 @@
 .. autofunction:: make_status_message
 .. autofunction:: make_rank_fname
 .. autofunction:: make_par_fname
+.. autoclass:: AsyncVisualizationWriter
 """
 
 __copyright__ = """
@@ -29,6 +30,9 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import numpy as np
 from meshmode.mesh import BTAG_ALL, BTAG_NONE  # noqa
 
 
@@ -74,3 +78,148 @@ def make_rank_fname(basename, rank=0, step=0, t=0):
 def make_par_fname(basename, step=0, t=0):
     r"""Make parallel visualization filename."""
     return f"{basename}-{step:06d}.pvtu"
+
+
+class _RankInfo:
+    """The rank and size of a communicator, queried ahead of time."""
+
+    def __init__(self, mpicomm):
+        self.rank = mpicomm.Get_rank()
+        self.size = mpicomm.Get_size()
+
+    def Get_rank(self):  # noqa: N802
+        return self.rank
+
+    def Get_size(self):  # noqa: N802
+        return self.size
+
+
+def _map_dof_arrays(f, field):
+    """Apply *f* to each :class:`~meshmode.dof_array.DOFArray` in *field*.
+
+    *field* may be a :class:`~meshmode.dof_array.DOFArray`, an object array or
+    a data class of those, or a constant, which is returned unchanged.
+    """
+    from dataclasses import fields, is_dataclass, replace
+    from meshmode.dof_array import DOFArray
+
+    if isinstance(field, DOFArray):
+        return f(field)
+    if is_dataclass(field):
+        return replace(field, **{
+            fld.name: _map_dof_arrays(f, getattr(field, fld.name))
+            for fld in fields(field)})
+    if isinstance(field, np.ndarray) and field.dtype.char == "O":
+        from pytools.obj_array import obj_array_vectorize
+        return obj_array_vectorize(partial(_map_dof_arrays, f), field)
+    return field
+
+
+class AsyncVisualizationWriter:
+    """Write visualization files in the background.
+
+    Wraps a :class:`meshmode.discretization.visualization.Visualizer` so that
+    :meth:`write_parallel_vtk_file` returns once the fields have been copied
+    to the host, and the resampling and file output happen on a worker thread,
+    overlapping with the following time steps. At most one write is in flight
+    at a time; starting a new one first waits for the previous one to finish.
+
+    The worker thread never touches the array context or the communicator of
+    the caller: it resamples the host copies on an array context with its own
+    command queue, and is only handed the rank and size of the communicator.
+    The first write runs on the calling thread, so that the visualizer sets
+    up its cached nodes and connectivity with the array context of its
+    discretization.
+
+    Since all MPI calls stay on the calling thread, writing in the background
+    only needs an MPI library initialized with at least
+    ``MPI_THREAD_FUNNELED``. With ``MPI_THREAD_SINGLE``, no other thread may
+    run at all, so writes with a communicator are done on the calling thread.
+
+    .. automethod:: __init__
+    .. automethod:: write_parallel_vtk_file
+    .. automethod:: wait
+    .. automethod:: close
+    """
+
+    def __init__(self, visualizer):
+        """Wrap *visualizer*."""
+        self._visualizer = visualizer
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending = None
+        self._worker_actx = None
+        self._nwrites = 0
+
+    def _write_in_background(self, mpicomm):
+        if self._nwrites == 0:
+            return False
+        if mpicomm is None:
+            return True
+
+        from mpi4py import MPI
+        return MPI.Query_thread() >= MPI.THREAD_FUNNELED
+
+    def _get_worker_actx(self, cl_context):
+        if self._worker_actx is None:
+            import pyopencl as cl
+            from meshmode.array_context import PyOpenCLArrayContext
+            self._worker_actx = PyOpenCLArrayContext(cl.CommandQueue(cl_context))
+        return self._worker_actx
+
+    def write_parallel_vtk_file(self, mpicomm, file_name_pattern,
+                                names_and_fields, **kwargs):
+        """Start writing *names_and_fields*, see the wrapped visualizer."""
+        self.wait()
+
+        background = self._write_in_background(mpicomm)
+        self._nwrites += 1
+        if not background:
+            self._visualizer.write_parallel_vtk_file(
+                mpicomm, file_name_pattern, names_and_fields, **kwargs)
+            return
+
+        from meshmode.dof_array import DOFArray
+        cl_contexts = set()
+
+        def to_host(ary):
+            actx = ary.array_context
+            cl_contexts.add(actx.context)
+            return DOFArray.from_list(None, [actx.to_numpy(grp) for grp in ary])
+
+        host_names_and_fields = [
+            (name, _map_dof_arrays(to_host, field))
+            for name, field in names_and_fields]
+        rank_info = None if mpicomm is None else _RankInfo(mpicomm)
+
+        def write():
+            if cl_contexts:
+                cl_context, = cl_contexts
+                actx = self._get_worker_actx(cl_context)
+
+                def from_host(ary):
+                    return DOFArray.from_list(
+                        actx, [actx.from_numpy(grp) for grp in ary])
+
+                names_and_fields = [
+                    (name, _map_dof_arrays(from_host, field))
+                    for name, field in host_names_and_fields]
+            else:
+                names_and_fields = host_names_and_fields
+
+            self._visualizer.write_parallel_vtk_file(
+                rank_info, file_name_pattern, names_and_fields, **kwargs)
+
+        self._pending = self._executor.submit(write)
+
+    def wait(self):
+        """Wait for the write in flight, if any, re-raising its errors."""
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            pending.result()
+
+    def close(self):
+        """Finish the write in flight and stop the worker thread."""
+        try:
+            self.wait()
+        finally:
+            self._executor.shutdown()
@@ -2,6 +2,7 @@
 
 .. autofunction:: check_step
 .. autofunction:: inviscid_sim_timestep
+.. autofunction:: compare_states
 .. autoexception:: ExactSolutionMismatch
 .. autofunction:: sim_checkpoint
 .. autofunction:: create_parallel_grid
@@ -32,12 +33,15 @@ THE SOFTWARE.
 """
 
 import logging
+from functools import partial, reduce
 
-import numpy as np
+from pytools import memoize_in
 from meshmode.dof_array import thaw
 from mirgecom.io import make_status_message
 from mirgecom.euler import (
     get_inviscid_timestep,
+    get_inviscid_cfl,
+    split_conserved,
 )
 
 logger = logging.getLogger(__name__)
@@ -55,13 +59,7 @@ def check_step(step, interval):
     Useful for checking whether the current step is an output step,
     or anyting else that occurs on fixed intervals.
     """
-    if interval == 0:
-        return True
-    elif interval < 0:
-        return False
-    elif step % interval == 0:
-        return True
-    return False
+    return bool(interval == 0 or (interval > 0 and step % interval == 0))
 
 
 def inviscid_sim_timestep(discr, state, t, dt, cfl, eos,
@@ -76,6 +74,50 @@ def inviscid_sim_timestep(discr, state, t, dt, cfl, eos,
     return mydt
 
 
+def compare_states(red, blue):
+    """Return the max-norm of the difference of two states, per component.
+
+    *red* and *blue* are agglomerated object arrays of DOF arrays with the
+    same layout. The difference is never stored: each group of each component
+    is reduced by a single kernel that computes ``fabs(red[i] - blue[i])`` on
+    the fly. The per-component results are gathered on the device and read
+    back in a single transfer.
+
+    Returns
+    -------
+    numpy.ndarray
+        The rank-local maximum absolute difference of each component, which
+        is infinite for components whose difference has a NaN
+    """
+    actx = red[0].array_context
+    dtype = red[0].entry_dtype
+
+    @memoize_in(actx, (compare_states, "max_abs_diff_knl", dtype))
+    def knl():
+        from pyopencl.reduction import ReductionKernel
+        from pyopencl.tools import dtype_to_ctype
+        ctype = dtype_to_ctype(dtype)
+        # fmax ignores NaNs, so report them as infinite to keep a blown up
+        # state visible
+        return ReductionKernel(actx.context, dtype, neutral="0",
+                               reduce_expr="fmax(a, b)",
+                               map_expr="isnan(red[i] - blue[i]) ? INFINITY"
+                               " : fabs(red[i] - blue[i])",
+                               arguments=f"__global const {ctype} *red, "
+                               f"__global const {ctype} *blue")
+
+    import pyopencl.array as cla
+
+    comp_maxes = [
+        reduce(partial(cla.maximum, queue=actx.queue), [
+            knl()(red_grp, blue_grp, queue=actx.queue)
+            for red_grp, blue_grp in zip(red_comp, blue_comp)
+        ]).reshape(1)
+        for red_comp, blue_comp in zip(red, blue)
+    ]
+    return cla.concatenate(comp_maxes, queue=actx.queue).get()
+
+
 class ExactSolutionMismatch(Exception):
     """Exception class for solution mismatch.
 
@@ -93,29 +135,45 @@ class ExactSolutionMismatch(Exception):
 
 def sim_checkpoint(discr, visualizer, eos, q, vizname, exact_soln=None,
                    step=0, t=0, dt=0, cfl=1.0, nstatus=-1, nviz=-1, exittol=1e-16,
-                   constant_cfl=False, comm=None, overwrite=False):
-    """Check simulation health, status, viz dumps, and restart."""
+                   constant_cfl=False, comm=None, overwrite=False, nodes=None,
+                   rank=None):
+    """Check simulation health, status, viz dumps, and restart.
+
+    The nodal coordinates *nodes* are only needed to evaluate *exact_soln*;
+    callers that already hold them thawed can pass them in. Otherwise they are
+    thawed once and cached on *discr*. Likewise, *rank* defaults to the rank
+    of *comm* (or 0 without a communicator) if not given.
+
+    With *comm* and *exact_soln* given, the errors are reduced over all ranks,
+    so this must be called collectively; every rank then raises
+    :class:`ExactSolutionMismatch` together.
+    """
     # TODO: Add restart
     do_viz = check_step(step=step, interval=nviz)
     do_status = check_step(step=step, interval=nstatus)
     if do_viz is False and do_status is False:
         return 0
 
-    from mirgecom.euler import split_conserved
     cv = split_conserved(discr.dim, q)
     dependent_vars = eos.dependent_vars(cv)
 
-    rank = 0
-    if comm is not None:
-        rank = comm.Get_rank()
+    if rank is None:
+        rank = 0 if comm is None else comm.Get_rank()
 
     maxerr = 0.0
     if exact_soln is not None:
         actx = cv.mass.array_context
-        nodes = thaw(actx, discr.nodes())
+        if nodes is None:
+            @memoize_in(discr, (sim_checkpoint, "thawed_nodes"))
+            def thawed_nodes():
+                return thaw(actx, discr.nodes())
+
+            nodes = thawed_nodes()
         expected_state = exact_soln(t=t, x_vec=nodes, eos=eos)
-        exp_resid = q - expected_state
-        err_norms = [discr.norm(v, np.inf) for v in exp_resid]
+        err_norms = compare_states(q, expected_state)
+        if comm is not None:
+            from mpi4py import MPI
+            comm.Allreduce(MPI.IN_PLACE, err_norms, op=MPI.MAX)
         maxerr = max(err_norms)
 
     if do_viz:
@@ -136,9 +194,10 @@ def sim_checkpoint(discr, visualizer, eos, q, vizname, exact_soln=None,
             par_manifest_filename=make_par_fname(basename=vizname, step=step, t=t))
 
     if do_status is True:
-        #        if constant_cfl is False:
-        #            current_cfl = get_inviscid_cfl(discr=discr, q=q,
-        #                                           eos=eos, dt=dt)
+        # With a fixed dt the CFL varies with the state, and it is only
+        # needed for this message
+        if constant_cfl is False:
+            cfl = get_inviscid_cfl(discr=discr, q=q, eos=eos, dt=dt)
         statusmesg = make_status_message(discr=discr, t=t, step=step, dt=dt,
                                          cfl=cfl, dependent_vars=dependent_vars)
         if exact_soln is not None:
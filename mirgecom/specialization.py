@@ -0,0 +1,89 @@
+"""An array context that specializes kernels to the sizes they run at."""
+
+__copyright__ = """
+Copyright (C) 2020 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+from meshmode.array_context import PyOpenCLArrayContext
+from pymbolic.primitives import Variable
+import loopy as lp
+
+__doc__ = """
+.. autoclass:: PyOpenCLShapeSpecializingArrayContext
+"""
+
+
+class PyOpenCLShapeSpecializingArrayContext(PyOpenCLArrayContext):
+    """An array context that specializes kernels to their argument shapes.
+
+    The first time a loopy program is called with a given set of argument
+    shapes, every integer parameter of the program that only sets the extent
+    of an array argument (e.g. the number of elements or of DOFs per element)
+    is fixed to its value with :func:`loopy.fix_parameters`. The specialized
+    program is cached and reused for later calls with the same shapes, so that
+    the generated code has constant loop bounds and no shape arithmetic.
+
+    .. automethod:: call_loopy
+
+    Inherits from :class:`meshmode.array_context.PyOpenCLArrayContext`.
+    """
+
+    def __init__(self, queue, allocator=None) -> None:
+        super().__init__(queue, allocator)
+        self.specialized_programs = {}
+
+    def _get_shape_parameters(self, program, kwargs: dict) -> dict:
+        params = {}
+        for arg in program.args:
+            # Scalar arguments (e.g. numpy scalars) have a shape too, but
+            # their loopy ValueArg does not
+            arg_shape = getattr(arg, "shape", None)
+            shape = getattr(kwargs.get(arg.name), "shape", None)
+            if shape is None or not isinstance(arg_shape, tuple):
+                continue
+
+            for axis_expr, axis_len in zip(arg_shape, shape):
+                if (isinstance(axis_expr, Variable)
+                        and axis_expr.name not in kwargs
+                        and isinstance(program.arg_dict.get(axis_expr.name),
+                                       lp.ValueArg)):
+                    params[axis_expr.name] = axis_len
+
+        return params
+
+    def call_loopy(self, program, **kwargs) -> dict:
+        """Execute the loopy kernel, specialized to the shapes in *kwargs*."""
+        params = self._get_shape_parameters(program, kwargs)
+        # Hashing a whole kernel on every call is costly, so key on its
+        # identity. The cache entry keeps *program* alive, so its id cannot
+        # be reused by another kernel.
+        key = (id(program), tuple(sorted(params.items())))
+
+        try:
+            _, specialized = self.specialized_programs[key]
+        except KeyError:
+            specialized = (lp.fix_parameters(program, **params) if params
+                           else program)
+            self.specialized_programs[key] = (program, specialized)
+
+        return super().call_loopy(specialized, **kwargs)
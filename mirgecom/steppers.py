@@ -43,10 +43,13 @@ def advance_state(rhs, timestepper, checkpoint, get_timestep,
         Function is user-defined and can be used to preform simulation status
         reporting, viz, and restart i/o.  A non-zero return code from this function
         indicates that this function should stop gracefully.
-    get_timestep
-        Function that should return dt for the next step. This interface allows
-        user-defined adaptive timestepping. A negative return value indicated that
-        the stepper should stop gracefully.
+    get_timestep: callable or float
+        Either a function that should return dt for the next step, or a fixed
+        dt. A function allows user-defined adaptive timestepping; a negative
+        return value indicates that the stepper should stop gracefully.
+        With a fixed dt, step *i* starts at ``t + i*dt`` and the last step is
+        shortened to end exactly at *t_final*. A fixed dt must be positive,
+        otherwise :exc:`ValueError` is raised.
     state: numpy.ndarray
         Agglomerated object array containing at least the state variables that
         will be advanced by this stepper
@@ -68,6 +71,29 @@ def advance_state(rhs, timestepper, checkpoint, get_timestep,
     if t_final <= t:
         return istep, t, state
 
+    if not callable(get_timestep):
+        from math import ceil
+        dt = get_timestep
+        if not dt > 0:
+            raise ValueError(f"fixed timestep must be positive, got {dt}")
+
+        # Step times are t0 + i*dt rather than accumulated, so they do not
+        # drift; the last step ends at t_final
+        t0 = t
+        nsteps = ceil((t_final - t0) / dt)
+        for i in range(nsteps):
+            t = t0 + i*dt
+            if t >= t_final:
+                break
+            t_next = (t_final if i == nsteps - 1
+                      else min(t0 + (i+1)*dt, t_final))
+
+            checkpoint(state=state, step=istep, t=t, dt=t_next - t)
+            state = timestepper(state=state, t=t, dt=t_next - t, rhs=rhs)
+            istep += 1
+
+        return istep, t_final, state
+
     while t < t_final:
 
         dt = get_timestep(state=state)
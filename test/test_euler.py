@@ -324,6 +324,41 @@ def test_inviscid_mom_flux_components(actx_factory, dim, livedim):
                         assert la.norm(flux[2+i, j].get()) == 0.0
 
 
+@pytest.mark.parametrize("dim", [1, 2, 3])
+def test_flatten_conserved(actx_factory, dim):
+    """Check that packing a state into its contiguous (ncomp, ndofs) form
+    with :func:`mirgecom.euler.flatten_conserved` keeps each component in its
+    own row, and that :func:`mirgecom.euler.unflatten_conserved` recovers the
+    state exactly.
+    """
+    actx = actx_factory()
+
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    mesh = generate_regular_rect_mesh(
+        a=(-5,) * dim, b=(5,) * dim, n=(4,) * dim
+    )
+
+    discr = EagerDGDiscretization(actx, mesh, order=2)
+    nodes = thaw(actx, discr.nodes())
+
+    lump = Lump(center=np.zeros(shape=(dim,)), velocity=np.ones(shape=(dim,)))
+    q = lump(0, nodes)
+
+    from meshmode.dof_array import flatten
+    from mirgecom.euler import flatten_conserved, unflatten_conserved
+
+    soa = flatten_conserved(q)
+    assert soa.shape == (dim + 2, flatten(q[0]).shape[0])
+
+    soa_host = actx.to_numpy(soa)
+    for i in range(dim + 2):
+        assert np.array_equal(soa_host[i], actx.to_numpy(flatten(q[i])))
+
+    q_roundtrip = unflatten_conserved(actx, discr, soa)
+    for i in range(dim + 2):
+        assert discr.norm(q_roundtrip[i] - q[i], np.inf) == 0.0
+
+
 @pytest.mark.parametrize("order", [1, 2, 3])
 @pytest.mark.parametrize("dim", [1, 2, 3])
 def test_facial_flux(actx_factory, order, dim):
@@ -0,0 +1,122 @@
+__copyright__ = """
+Copyright (C) 2020 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+
+import logging
+import numpy as np
+import pytest
+
+from pytools.obj_array import make_obj_array
+from meshmode.dof_array import thaw
+from grudge.eager import EagerDGDiscretization
+from mirgecom.integrators import rk4_step
+from meshmode.array_context import (  # noqa
+    pytest_generate_tests_for_pyopencl_array_context
+    as pytest_generate_tests)
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.parametrize("nvars", [1, 4])
+def test_rk4_host_order(nvars):
+    """Check that :func:`mirgecom.integrators.rk4_step` on a plain numpy
+    array state integrates y' = -y with fourth order accuracy, and does
+    not modify the state it is given.
+    """
+    from pytools.convergence import EOCRecorder
+    eoc_rec = EOCRecorder()
+
+    rates = np.arange(1, nvars + 1, dtype=np.float64)
+
+    def rhs(t, y):
+        return -rates * y
+
+    t_final = 1.0
+    for nsteps in [10, 20, 40]:
+        dt = t_final / nsteps
+        y0 = np.ones(nvars)
+        y = y0
+        for istep in range(nsteps):
+            y = rk4_step(y, istep * dt, dt, rhs)
+
+        assert np.all(y0 == 1.0)
+        err = np.max(np.abs(y - np.exp(-rates * t_final)))
+        eoc_rec.add_data_point(dt, err)
+
+    logger.info(f"RK4 errors:\n{eoc_rec}")
+    assert eoc_rec.order_estimate() >= 3.9
+
+
+def _generic_rk4_step(state, t, dt, rhs):
+    k1 = rhs(t, state)
+    k2 = rhs(t+dt/2, state + dt/2*k1)
+    k3 = rhs(t+dt/2, state + dt/2*k2)
+    k4 = rhs(t+dt, state + dt*k3)
+    return state + dt/6*(k1 + 2*k2 + 2*k3 + k4)
+
+
+def _check_rk4_dof_array(actx, nvars):
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    mesh = generate_regular_rect_mesh(a=(-1,) * 2, b=(1,) * 2, n=(4,) * 2)
+
+    discr = EagerDGDiscretization(actx, mesh, order=2)
+    nodes = thaw(actx, discr.nodes())
+
+    rates = [float(i + 1) for i in range(nvars)]
+    y0 = make_obj_array([1 + (i + 1)*nodes[0]**2 for i in range(nvars)])
+
+    def rhs(t, y):
+        return make_obj_array([-rates[i]*y[i] for i in range(nvars)])
+
+    y_fused = rk4_step(y0, 0, 0.1, rhs)
+    y_generic = _generic_rk4_step(y0, 0, 0.1, rhs)
+    for i in range(nvars):
+        assert discr.norm(y_fused[i] - y_generic[i], np.inf) < 1e-14
+
+    from pytools.convergence import EOCRecorder
+    eoc_rec = EOCRecorder()
+
+    t_final = 1.0
+    for nsteps in [10, 20, 40]:
+        dt = t_final / nsteps
+        y = y0
+        for istep in range(nsteps):
+            y = rk4_step(y, istep * dt, dt, rhs)
+
+        err = max(
+            discr.norm(y[i] - float(np.exp(-rates[i] * t_final))*y0[i], np.inf)
+            for i in range(nvars))
+        eoc_rec.add_data_point(dt, err)
+
+    logger.info(f"RK4 errors:\n{eoc_rec}")
+    assert eoc_rec.order_estimate() >= 3.9
+
+
+@pytest.mark.parametrize("nvars", [1, 4])
+def test_rk4_dof_array_order(actx_factory, nvars):
+    """Check that the fused kernels used by :func:`mirgecom.integrators.rk4_step`
+    on an object array of DOF arrays agree with the plain object array
+    arithmetic, and integrate y' = -y with fourth order accuracy.
+    """
+    _check_rk4_dof_array(actx_factory(), nvars)
@@ -0,0 +1,100 @@
+__copyright__ = """
+Copyright (C) 2020 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+
+import logging
+import numpy as np
+import pytest
+
+from meshmode.dof_array import thaw
+from grudge.eager import EagerDGDiscretization
+from grudge.shortcuts import make_visualizer
+from mirgecom.initializers import Lump
+from mirgecom.euler import split_conserved
+from mirgecom.io import AsyncVisualizationWriter
+from meshmode.array_context import (  # noqa
+    pytest_generate_tests_for_pyopencl_array_context
+    as pytest_generate_tests)
+
+logger = logging.getLogger(__name__)
+
+
+class _FailingVisualizer:
+    def write_parallel_vtk_file(self, mpicomm, file_name_pattern,
+                                names_and_fields, **kwargs):
+        raise RuntimeError("write failed")
+
+
+def test_async_viz_writer_errors():
+    """Check that errors in writes done by
+    :class:`mirgecom.io.AsyncVisualizationWriter` on its worker thread are
+    re-raised by :meth:`~mirgecom.io.AsyncVisualizationWriter.wait` and
+    :meth:`~mirgecom.io.AsyncVisualizationWriter.close`.
+    """
+    writer = AsyncVisualizationWriter(_FailingVisualizer())
+
+    # The first write is done on the calling thread
+    with pytest.raises(RuntimeError):
+        writer.write_parallel_vtk_file(None, "viz-{rank:04d}.vtu", [])
+
+    writer.write_parallel_vtk_file(None, "viz-{rank:04d}.vtu", [])
+    with pytest.raises(RuntimeError):
+        writer.wait()
+
+    writer.write_parallel_vtk_file(None, "viz-{rank:04d}.vtu", [])
+    with pytest.raises(RuntimeError):
+        writer.close()
+
+
+@pytest.mark.parametrize("dim", [2, 3])
+def test_async_viz_writer_output(actx_factory, tmp_path, dim):
+    """Check that a visualization file written in the background by
+    :class:`mirgecom.io.AsyncVisualizationWriter` is identical to the one
+    the wrapped visualizer writes directly.
+    """
+    actx = actx_factory()
+
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    mesh = generate_regular_rect_mesh(a=(-5,) * dim, b=(5,) * dim, n=(4,) * dim)
+
+    discr = EagerDGDiscretization(actx, mesh, order=2)
+    nodes = thaw(actx, discr.nodes())
+
+    lump = Lump(center=np.zeros(shape=(dim,)), velocity=np.ones(shape=(dim,)))
+    q = lump(0, nodes)
+    io_fields = [("cv", split_conserved(dim, q)), ("rho_x", q[0]*nodes[0])]
+
+    visualizer = make_visualizer(discr, discr.order)
+    visualizer.write_parallel_vtk_file(
+        None, str(tmp_path / "sync-{rank:04d}.vtu"), io_fields)
+
+    writer = AsyncVisualizationWriter(visualizer)
+    for step in range(2):
+        writer.write_parallel_vtk_file(
+            None, str(tmp_path / f"async{step}-{{rank:04d}}.vtu"), io_fields)
+    writer.close()
+
+    expected = (tmp_path / "sync-0000.vtu").read_bytes()
+    for step in range(2):
+        assert (tmp_path / f"async{step}-0000.vtu").read_bytes() == expected
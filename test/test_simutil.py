@@ -0,0 +1,89 @@
+__copyright__ = """
+Copyright (C) 2020 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import logging
+import numpy as np
+import pytest
+
+from meshmode.dof_array import thaw
+from grudge.eager import EagerDGDiscretization
+from mirgecom.initializers import Vortex2D
+from mirgecom.simutil import check_step, compare_states
+from meshmode.array_context import (  # noqa
+    pytest_generate_tests_for_pyopencl_array_context
+    as pytest_generate_tests)
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.parametrize(("step", "interval", "expected"), [
+    (0, 0, True),
+    (7, 0, True),
+    (0, -1, False),
+    (10, -1, False),
+    (0, 5, True),
+    (10, 5, True),
+    (11, 5, False),
+    ])
+def test_check_step(step, interval, expected):
+    """Check the step/interval logic used to schedule status and viz output.
+
+    Zero intervals always trigger, negative intervals never do, and positive
+    intervals trigger on multiples of the interval. The result is a plain
+    :class:`bool` even for numpy step numbers.
+    """
+    assert check_step(step=step, interval=interval) is expected
+    assert check_step(step=np.int64(step), interval=interval) is expected
+
+
+@pytest.mark.parametrize("order", [1, 3])
+def test_compare_states(actx_factory, order):
+    """Check that the fused per-component comparison
+    :func:`mirgecom.simutil.compare_states` agrees with the max-norm of the
+    explicitly formed difference of two states, and reports NaNs as
+    infinite errors.
+    """
+    actx = actx_factory()
+
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    mesh = generate_regular_rect_mesh(a=(-5,) * 2, b=(5,) * 2, n=(8,) * 2)
+
+    discr = EagerDGDiscretization(actx, mesh, order=order)
+    nodes = thaw(actx, discr.nodes())
+
+    red = Vortex2D(center=[0, 0], velocity=[1, 1])(0, nodes)
+    blue = Vortex2D(center=[0, 0], velocity=[1, 1])(0.1, nodes)
+
+    expected = [discr.norm(v, np.inf) for v in red - blue]
+    err_norms = compare_states(red, blue)
+
+    assert len(err_norms) == len(red)
+    assert np.allclose(err_norms, expected, rtol=1e-14, atol=0)
+    assert np.all(compare_states(red, red) == 0)
+
+    nan_state = red.copy()
+    nan_state[1] = np.nan * red[1]
+    nan_err_norms = compare_states(red, nan_state)
+    assert nan_err_norms[1] == np.inf
+    assert np.all(np.delete(nan_err_norms, 1) == 0)
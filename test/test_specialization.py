@@ -0,0 +1,99 @@
+__copyright__ = """
+Copyright (C) 2020 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+
+import logging
+import numpy as np
+import pytest
+
+from pytools.obj_array import make_obj_array
+from meshmode.dof_array import thaw
+from grudge.eager import EagerDGDiscretization
+from mirgecom.initializers import Lump
+from mirgecom.integrators import rk4_step
+from mirgecom.specialization import PyOpenCLShapeSpecializingArrayContext
+from meshmode.array_context import (  # noqa
+    pytest_generate_tests_for_pyopencl_array_context
+    as pytest_generate_tests)
+
+logger = logging.getLogger(__name__)
+
+
+def _make_discr(actx, dim):
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    mesh = generate_regular_rect_mesh(a=(-5,) * dim, b=(5,) * dim, n=(4,) * dim)
+    return EagerDGDiscretization(actx, mesh, order=2)
+
+
+@pytest.mark.parametrize("dim", [1, 2])
+def test_specialized_rk4_step(actx_factory, dim):
+    """Check that the fused RK4 kernels, which take scalar arguments, run
+    under :class:`mirgecom.specialization.PyOpenCLShapeSpecializingArrayContext`
+    and give the same result as with the plain array context. Repeated steps
+    must reuse the specialized kernels.
+    """
+    plain_actx = actx_factory()
+    actx = PyOpenCLShapeSpecializingArrayContext(plain_actx.queue)
+
+    def rhs(t, y):
+        return make_obj_array([-y[i] for i in range(len(y))])
+
+    results = []
+    for ctx in [plain_actx, actx]:
+        discr = _make_discr(ctx, dim)
+        nodes = thaw(ctx, discr.nodes())
+        y = make_obj_array([1 + nodes[0]**2, 2 + nodes[0]])
+        y = rk4_step(y, 0, 0.1, rhs)
+        results.append([ctx.to_numpy(comp[0]) for comp in y])
+
+    nprograms = len(actx.specialized_programs)
+    assert nprograms > 0
+
+    y = rk4_step(y, 0.1, 0.1, rhs)
+    assert len(actx.specialized_programs) == nprograms
+
+    for plain_comp, specialized_comp in zip(*results):
+        assert np.allclose(specialized_comp, plain_comp, rtol=1e-14, atol=0)
+
+
+@pytest.mark.parametrize("dim", [1, 2, 3])
+def test_specialized_flatten_conserved(actx_factory, dim):
+    """Check that packing and unpacking a state with
+    :func:`mirgecom.euler.flatten_conserved` and
+    :func:`mirgecom.euler.unflatten_conserved` runs under
+    :class:`mirgecom.specialization.PyOpenCLShapeSpecializingArrayContext`.
+    """
+    actx = PyOpenCLShapeSpecializingArrayContext(actx_factory().queue)
+
+    discr = _make_discr(actx, dim)
+    nodes = thaw(actx, discr.nodes())
+
+    lump = Lump(center=np.zeros(shape=(dim,)), velocity=np.ones(shape=(dim,)))
+    q = lump(0, nodes)
+
+    from mirgecom.euler import flatten_conserved, unflatten_conserved
+
+    q_roundtrip = unflatten_conserved(actx, discr, flatten_conserved(q))
+    for i in range(dim + 2):
+        assert discr.norm(q_roundtrip[i] - q[i], np.inf) == 0.0
@@ -0,0 +1,84 @@
+__copyright__ = """
+Copyright (C) 2020 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+
+import pytest
+
+from mirgecom.steppers import advance_state
+
+
+@pytest.mark.parametrize(("dt", "nsteps"), [
+    (0.25, 4),
+    (0.3, 4),
+    (0.1, 10),
+    ])
+def test_advance_state_fixed_dt(dt, nsteps):
+    """Check that :func:`mirgecom.steppers.advance_state` with a fixed timestep
+    takes the expected number of steps, checkpoints before each of them, and
+    shortens the last step to end exactly at *t_final*.
+    """
+    t_final = 1.0
+    steps = []
+    checkpoints = []
+
+    def timestepper(state, t, dt, rhs):
+        steps.append((t, dt))
+        return state + dt
+
+    def checkpoint(state, step, t, dt):
+        checkpoints.append((step, t, dt))
+
+    istep, t, state = advance_state(rhs=None, timestepper=timestepper,
+                                    checkpoint=checkpoint, get_timestep=dt,
+                                    state=0.0, t_final=t_final, istep=3)
+
+    assert istep == 3 + nsteps
+    assert t == t_final
+    assert abs(state - t_final) < 1e-14
+
+    assert len(steps) == nsteps
+    assert steps[-1][0] + steps[-1][1] == t_final
+    for (t_step, dt_step), (t_next, _) in zip(steps[:-1], steps[1:]):
+        assert abs(dt_step - dt) < 1e-14
+        assert t_step + dt_step == t_next
+    assert 0 < steps[-1][1] <= dt + 1e-14
+
+    assert checkpoints == [
+        (3 + i, t_step, dt_step) for i, (t_step, dt_step) in enumerate(steps)]
+
+
+@pytest.mark.parametrize("dt", [0.0, -0.1])
+def test_advance_state_nonpositive_dt(dt):
+    """Check that :func:`mirgecom.steppers.advance_state` rejects a fixed
+    timestep that is not positive.
+    """
+    def timestepper(state, t, dt, rhs):
+        raise AssertionError("no step should be taken")
+
+    def checkpoint(state, step, t, dt):
+        raise AssertionError("no checkpoint should be written")
+
+    with pytest.raises(ValueError):
+        advance_state(rhs=None, timestepper=timestepper, checkpoint=checkpoint,
+                      get_timestep=dt, state=0.0, t_final=1.0)